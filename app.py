@@ -1,6 +1,6 @@
 import dash
 from dash import dcc, html
-from dash.dependencies import Input, Output, State
+from dash.dependencies import Input, Output, State, ClientsideFunction
 import base64
 import os
 import uuid
@@ -11,6 +11,8 @@ from components.DataAndModelInitializer import DataAndModelInitializer
 from components.EmbeddingProcessor import EmbeddingProcessor
 from components.linkedin_pdf_parser import extract_linkedin_info
 from components.VisualizationTools import VisualizationTools
+from components.NearbyJobs import NearbyJobs
+from components.RenderStore import RenderStore, render_versions, salary_key, map_key, areas_key
 
 # -------------------------------
 # Setup
@@ -21,6 +23,9 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app = dash.Dash(__name__)
 app.title = "Monty - LinkedIn Career Insight"
 
+# Results pre-rendered by prerender.py; live rendering is the fallback
+render_store = RenderStore()
+
 # -------------------------------
 # Global placeholders (lazy load)
 # -------------------------------
@@ -28,7 +33,8 @@ data_loader = None
 matcher = None
 job_df = None
 viz_tools = None
-_geo_cache = None
+nearby_jobs = None
+_geo_cache = {}
 
 
 # -------------------------------
@@ -36,7 +42,7 @@ _geo_cache = None
 # -------------------------------
 def ensure_initialized():
     """Initialize heavy components only once."""
-    global data_loader, matcher, job_df, viz_tools
+    global data_loader, matcher, job_df, viz_tools, nearby_jobs
     if data_loader is None:
         print("Initializing model and data on demand...")
         data_loader = DataAndModelInitializer()
@@ -48,22 +54,73 @@ def ensure_initialized():
             "matcher": matcher_local,
             "job_df": job_df_local,
             "viz_tools": viz_tools_local,
+            "nearby_jobs": NearbyJobs(),
         })
 
 
 def get_geo_df(top_job_title=None):
-    """Load geographic data only when absolutely required."""
-    global _geo_cache
-    if _geo_cache is not None:
-        return _geo_cache
+    """Load geographic data only when absolutely required (cached per occupation)."""
+    if top_job_title in _geo_cache:
+        return _geo_cache[top_job_title]
     try:
         if data_loader is None:
             ensure_initialized()
-        _geo_cache = data_loader.load_geographic_job_data(top_job_title)
+        geo_df = data_loader.load_geographic_job_data(top_job_title)
     except Exception as e:
         print("Warning: Could not load geographic data:", e)
-        _geo_cache = pd.DataFrame()
-    return _geo_cache
+        geo_df = pd.DataFrame()
+    _geo_cache[top_job_title] = geo_df
+    return geo_df
+
+
+def load_area_employment(top_job_title):
+    """Serve the pre-aggregated per-area employment, reading the geographic file if it is missing or stale."""
+    cached = render_store.get(areas_key(top_job_title), render_versions()["areas"])
+    if cached is not None:
+        return pd.DataFrame(cached["areas"], columns=["AREA_TITLE", "TOT_EMP"])
+    return data_loader.load_area_job_data(top_job_title)
+
+
+def build_nearby_section(location, top_job_title):
+    """List the closest areas employing the matched role and nearby postings."""
+    place = nearby_jobs.geocode(location)
+    if place is None or not top_job_title:
+        return html.P("📍 Could not place your profile location on the map.", style={'color': 'gray'})
+
+    lat, lon, matched_name = place
+    nearest_areas = nearby_jobs.occupation_areas_near(
+        top_job_title, load_area_employment, lat, lon, k=5
+    )
+    postings = nearby_jobs.postings_near(lat, lon, radius_miles=50)
+
+    return html.Div([
+        html.P(f"Closest match for your location: {matched_name}", style={'color': 'gray'}),
+        html.P(f"🏢 {len(postings):,} job postings within 50 miles."),
+        html.Ul([
+            html.Li(f"{row.AREA_TITLE}: {int(row.TOT_EMP):,} employed ({row.DISTANCE_MI} mi away)")
+            for row in nearest_areas.itertuples()
+        ]) if not nearest_areas.empty else html.P("No nearby areas report this role.", style={'color': 'gray'})
+    ])
+
+
+def get_salary_chart(top_job_title):
+    """Serve the pre-rendered salary chart, rendering live if it is missing or stale."""
+    cached = render_store.get(salary_key(top_job_title), render_versions()["salary"])
+    if cached is None:
+        return viz_tools.generate_salary_chart(job_df, top_job_title)
+    if cached["figure"] is None:
+        return dcc.Markdown("⚠️ Salary data not available for this role."), None, None
+    return dcc.Graph(figure=cached["figure"]), cached["role_salary"], cached["national_salary"]
+
+
+def get_geo_payload(top_job_title):
+    """Serve the pre-rendered state payload, building it live if it is missing or stale."""
+    cached = render_store.get(map_key(top_job_title), render_versions()["map"])
+    if cached is not None and cached["payload"] is not None:
+        return cached["payload"]
+    geo_df = get_geo_df(top_job_title)
+    print(f"Geo DF rows: {len(geo_df)}")
+    return viz_tools.build_state_payload(geo_df, top_job_title) if not geo_df.empty else None
 
 
 # -------------------------------
@@ -166,7 +223,16 @@ app.layout = html.Div([
         type='circle',
         fullscreen=False,
         children=html.Div(id='output-section')
-    )
+    ),
+
+    # Per-state aggregate for the matched occupation; filtered client-side
+    dcc.Store(id='geo-payload'),
+    html.Div(id='geo-section', style={'display': 'none'}, children=[
+        html.Hr(),
+        html.H4("🗺 Geographic Distribution of Jobs:"),
+        dcc.Markdown("This map shows which U.S. states employ the highest number of workers in your suggested job role."),
+        dcc.Graph(id='geo-map', config={'displayModeBar': False})
+    ])
 ])
 
 
@@ -174,12 +240,12 @@ app.layout = html.Div([
 # Main callback
 # -------------------------------
 @app.callback(
-    Output('output-section', 'children'),
-    [Input('submit-button', 'n_clicks'),
-     Input('region-filter', 'value')],
+    [Output('output-section', 'children'),
+     Output('geo-payload', 'data')],
+    [Input('submit-button', 'n_clicks')],
     [State('upload-pdf', 'contents')]
 )
-def update_output(n_clicks, region_filter, contents):
+def update_output(n_clicks, contents):
     if n_clicks > 0 and contents:
         ensure_initialized()
 
@@ -189,17 +255,12 @@ def update_output(n_clicks, region_filter, contents):
         top_roles = matcher.find_top_roles(match_input, job_df)
         top_job_title = top_roles[0][0] if top_roles else None
 
-        geo_df = get_geo_df(top_job_title) if top_job_title else pd.DataFrame()
-        print(f"Geo DF rows: {len(geo_df)}")
-
         salary_chart, role_salary, national_salary = (
-            viz_tools.generate_salary_chart(job_df, top_job_title)
+            get_salary_chart(top_job_title)
             if top_job_title else (None, None, None)
         )
 
-        geo_map_html = viz_tools.generate_geographic_map(
-            geo_df, top_job_title, region_filter
-        ) if not geo_df.empty else ""
+        geo_payload = get_geo_payload(top_job_title) if top_job_title else None
 
         ratio = round(role_salary / national_salary, 1) if national_salary else None
         direction = "higher" if ratio and ratio >= 1 else "lower"
@@ -243,11 +304,22 @@ def update_output(n_clicks, region_filter, contents):
             interpretation_text,
 
             html.Hr(),
-            html.H4("🗺 Geographic Distribution of Jobs:"),
-            dcc.Markdown("This map shows which U.S. states employ the highest number of workers in your suggested job role."),
-            html.Iframe(srcDoc=geo_map_html, width="100%", height="500")
-        ])
-    return ""
+            html.H4("📍 Jobs Near You:"),
+            build_nearby_section(profile['location'], top_job_title),
+        ]), geo_payload
+    return "", None
+
+
+# -------------------------------
+# Region filter (runs in the browser, see assets/geo_map.js)
+# -------------------------------
+app.clientside_callback(
+    ClientsideFunction(namespace='monty', function_name='stateChoropleth'),
+    [Output('geo-map', 'figure'),
+     Output('geo-section', 'style')],
+    [Input('geo-payload', 'data'),
+     Input('region-filter', 'value')]
+)
 
 
 # -------------------------------
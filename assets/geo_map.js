@@ -0,0 +1,70 @@
+// Client-side region filtering for the geographic employment map.
+// The server sends the per-state aggregate once (see
+// VisualizationTools.build_state_payload); switching the region dropdown
+// only filters and recolours the choropleth in the browser.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    monty: {
+        stateChoropleth: function (payload, region) {
+            var hidden = {display: 'none'};
+            if (!payload || !payload.states || !payload.states.length) {
+                return [{data: [], layout: {}}, hidden];
+            }
+
+            var regionIdx = payload.regions.indexOf(region);
+            var states = [], names = [], jobs = [];
+            for (var i = 0; i < payload.states.length; i++) {
+                if (region !== 'All' && payload.region[i] !== regionIdx) {
+                    continue;
+                }
+                states.push(payload.states[i]);
+                names.push(payload.names[i]);
+                jobs.push(payload.jobs[i]);
+            }
+
+            var title = payload.title + ' Employment by State (' + region + ')';
+            if (!states.length) {
+                return [{
+                    data: [],
+                    layout: {
+                        title: {text: title},
+                        annotations: [{
+                            text: 'No data available for ' + region + ' region.',
+                            showarrow: false, font: {color: 'gray'}
+                        }],
+                        xaxis: {visible: false}, yaxis: {visible: false},
+                        height: 500
+                    }
+                }, {}];
+            }
+
+            var text = names.map(function (name, j) {
+                return name + ': ' + jobs[j].toLocaleString() + ' jobs';
+            });
+
+            return [{
+                data: [{
+                    type: 'choropleth',
+                    locationmode: 'USA-states',
+                    locations: states,
+                    z: jobs,
+                    zmin: Math.min.apply(null, jobs),
+                    zmax: Math.max.apply(null, jobs),
+                    text: text,
+                    hoverinfo: 'text',
+                    colorscale: [
+                        [0, '#E0F3DB'], [0.33, '#A8DDB5'],
+                        [0.66, '#43A2CA'], [1, '#0868AC']
+                    ],
+                    colorbar: {title: {text: 'Employment Density'}},
+                    marker: {line: {color: 'white', width: 0.5}}
+                }],
+                layout: {
+                    title: {text: title},
+                    geo: {scope: 'usa', projection: {type: 'albers usa'}},
+                    margin: {l: 0, r: 0, t: 50, b: 0},
+                    height: 500
+                }
+            }, {}];
+        }
+    }
+});
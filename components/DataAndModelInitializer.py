@@ -1,6 +1,8 @@
 import pandas as pd
 import functools
-from sentence_transformers import SentenceTransformer
+
+NATIONAL_DATA_PATH = "project_data/oesm23nat/national_M2023_dl.xlsx"
+GEO_DATA_PATH = "project_data/oesm24all/all_data_M_2024.xlsx"
 
 
 class DataAndModelInitializer:
@@ -16,6 +18,8 @@ class DataAndModelInitializer:
         """Load SentenceTransformer model only once."""
         if self.model is None:
             print("Loading SentenceTransformer model on demand...")
+            # Imported here so torch is only pulled in on the first match
+            from sentence_transformers import SentenceTransformer
             # Lightweight model for Render / local environments
             self.model = SentenceTransformer('paraphrase-MiniLM-L3-v2')
         return self.model
@@ -26,7 +30,7 @@ class DataAndModelInitializer:
     def load_job_data(self):
         """Load and preprocess national-level occupational dataset."""
         try:
-            df = pd.read_excel("project_data/oesm23nat/national_M2023_dl.xlsx")
+            df = pd.read_excel(NATIONAL_DATA_PATH)
             keep_cols = ["OCC_TITLE", "A_MEAN", "A_MEDIAN", "H_MEAN", "TOT_EMP"]
             df = (
                 df[keep_cols]
@@ -60,10 +64,7 @@ class DataAndModelInitializer:
         try:
             print("📊 Loading full geographic dataset efficiently...")
 
-            xls = pd.ExcelFile(
-                "project_data/oesm24all/all_data_M_2024.xlsx",
-                engine="openpyxl"
-            )
+            xls = pd.ExcelFile(GEO_DATA_PATH, engine="openpyxl")
 
             # Read only needed columns
             df = pd.read_excel(
@@ -89,9 +90,12 @@ class DataAndModelInitializer:
     # ---------------------------
     def load_geographic_job_data(self, occupation_filter=None):
         """Return filtered geographic data for a given occupation (if provided)."""
-        try:
-            df = self._read_geo_file()
+        return self.filter_geographic_job_data(self._read_geo_file(), occupation_filter)
 
+    @staticmethod
+    def filter_geographic_job_data(df, occupation_filter=None):
+        """Keep state-level rows of df, optionally for a single occupation."""
+        try:
             # State list for filtering valid regions
             state_list = [
                 "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado",
@@ -120,3 +124,27 @@ class DataAndModelInitializer:
         except Exception as e:
             print("❌ Error filtering geographic job data:", e)
             return pd.DataFrame(columns=["AREA_TITLE", "OCC_TITLE", "TOT_EMP", "H_MEAN"])
+
+    # ---------------------------
+    # Filtered area-level subset (metro / nonmetro areas)
+    # ---------------------------
+    def load_all_area_job_data(self):
+        """Return every area's rows for every occupation (used by prerender.py)."""
+        return self._read_geo_file()
+
+    def load_area_job_data(self, occupation_filter):
+        """
+        Return every area's rows for a given occupation, for nearby-area lookups.
+        Titles are matched exactly (case-insensitive) so that e.g. "Actors" does
+        not also pull in "Chiropractors" and inflate the per-area totals.
+        """
+        try:
+            df = self._read_geo_file()
+            occ_title = occupation_filter.strip().lower()
+            df = df[df["OCC_TITLE"].str.strip().str.lower() == occ_title]
+            print(f"✅ Area data: {len(df):,} rows for '{occupation_filter}'")
+            return df.reset_index(drop=True)
+
+        except Exception as e:
+            print("❌ Error filtering area job data:", e)
+            return pd.DataFrame(columns=["AREA_TITLE", "OCC_TITLE", "TOT_EMP", "H_MEAN"])
@@ -1,20 +1,40 @@
 # components/EmbeddingProcessor.py
 
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
 class EmbeddingProcessor:
     def __init__(self, model):
         self.model = model
+        self._job_key = None
+        self._job_embeddings = None
+
+    def _normalized_job_embeddings(self, descriptions):
+        """Encode and L2-normalize job descriptions once per distinct job list."""
+        key = tuple(descriptions)
+        if self._job_key != key:
+            embeddings = np.asarray(
+                self.model.encode(descriptions, convert_to_tensor=False), dtype=np.float32
+            )
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self._job_embeddings = embeddings / norms
+            self._job_key = key
+        return self._job_embeddings
 
     def find_top_roles(self, user_input, job_df, top_n=3):
         if 'Description' not in job_df.columns or 'Occupation' not in job_df.columns:
             raise ValueError("job_df must have 'Occupation' and 'Description' columns")
 
-        user_embedding = self.model.encode(user_input, convert_to_tensor=False)
-        job_embeddings = self.model.encode(job_df['Description'].tolist(), convert_to_tensor=False)
+        user_embedding = np.asarray(
+            self.model.encode(user_input, convert_to_tensor=False), dtype=np.float32
+        )
+        user_norm = np.linalg.norm(user_embedding)
+        if user_norm:
+            user_embedding = user_embedding / user_norm
+        job_embeddings = self._normalized_job_embeddings(job_df['Description'].tolist())
 
-        similarities = cosine_similarity([user_embedding], job_embeddings)[0]
+        # Cosine similarity reduces to a dot product on unit vectors
+        similarities = job_embeddings @ user_embedding
         top_indices = np.argsort(similarities)[-top_n:][::-1]
 
         top_roles = []
@@ -0,0 +1,292 @@
+# components/NearbyJobs.py
+
+import re
+import pandas as pd
+
+from components.SpatialIndex import SpatialIndex
+from components.VisualizationTools import STATE_ABBR
+
+AREA_COORDS_PATH = "project_data/bls_area_lat_long.xlsx"
+POSTING_LOCS_PATH = "project_data/extra/posting_locs_2.xlsx"
+
+ABBR_STATE = {abbr.lower(): state.lower() for state, abbr in STATE_ABBR.items()}
+STATE_NAMES = {state.lower() for state in STATE_ABBR}
+
+# Slack (degrees) around a state's posting bounding box before an area
+# centroid is considered to lie outside the state
+STATE_BOUNDS_MARGIN = 0.5
+
+# Decorations LinkedIn adds around a place name ("Greater Boston Area")
+_LOCATION_NOISE = re.compile(
+    r"\b(greater|metropolitan|metro|bay area|area|region|united states|usa|us)\b"
+)
+
+
+def _normalize_place(text):
+    text = re.sub(r"[^a-z0-9,\- ]+", " ", str(text).lower())
+    return re.sub(r"\s+", " ", text).strip(" ,")
+
+
+class NearbyJobs:
+    """
+    Offline geocoding and "jobs near me" queries.
+
+    BLS areas (bls_area_lat_long.xlsx) and job posting locations
+    (posting_locs_2.xlsx) are loaded once and kept in SpatialIndex KD-trees,
+    so radius and k-nearest lookups never rescan the tables. Areas employing
+    a given occupation get their own index, cached per occupation.
+
+    Posting places carry exact city coordinates and take precedence when
+    geocoding. Some shipped area centroids are wrong (Portland, OR-WA sits in
+    Iowa), so an area whose centroid falls outside all of its states is moved
+    to its principal city's posting coordinates, or dropped if there are none.
+    """
+
+    def __init__(self, area_path=AREA_COORDS_PATH, posting_path=POSTING_LOCS_PATH):
+        self.area_path = area_path
+        self.posting_path = posting_path
+        self._areas = None
+        self._postings = None
+        self._area_index = None
+        self._posting_index = None
+        self._places = None
+        self._gazetteer = None
+        self._occupation_indexes = {}
+
+    # ---------------------------
+    # Data loading
+    # ---------------------------
+    def _load_areas(self):
+        if self._areas is None:
+            try:
+                df = pd.read_excel(self.area_path, usecols=["area_name", "latitude", "longitude"])
+                df = df.rename(columns={"area_name": "name", "latitude": "lat", "longitude": "lon"})
+                df["lat"] = pd.to_numeric(df["lat"], errors="coerce")
+                df["lon"] = pd.to_numeric(df["lon"], errors="coerce")
+                self._areas = self._fix_area_coords(df.dropna()).reset_index(drop=True)
+                print(f"✅ Area coordinates loaded: {len(self._areas)} areas")
+            except Exception as e:
+                print("❌ Error loading area coordinates:", e)
+                self._areas = pd.DataFrame(columns=["name", "lat", "lon"])
+        return self._areas
+
+    def _load_postings(self):
+        if self._postings is None:
+            try:
+                # Second column holds the place name; the first is a broken formula
+                df = pd.read_excel(self.posting_path, header=0).iloc[:, 1:4]
+                df.columns = ["name", "lat", "lon"]
+                df["lat"] = pd.to_numeric(df["lat"], errors="coerce")
+                df["lon"] = pd.to_numeric(df["lon"], errors="coerce")
+                self._postings = df.dropna().reset_index(drop=True)
+                print(f"✅ Posting locations loaded: {len(self._postings):,} postings")
+            except Exception as e:
+                print("❌ Error loading posting locations:", e)
+                self._postings = pd.DataFrame(columns=["name", "lat", "lon"])
+        return self._postings
+
+    def _posting_places(self):
+        """
+        (by_city_state, by_city, state_points) built from the posting place
+        names, e.g. "Princeton, New Jersey" or "Middlebury, Clay County, Indiana".
+        """
+        if self._places is None:
+            by_city_state, by_city, state_points = {}, {}, {}
+            for name, lat, lon in self._load_postings().itertuples(index=False):
+                parts = [_normalize_place(p) for p in str(name).split(",")]
+                state = parts[-1] if len(parts) > 1 and parts[-1] in STATE_NAMES else None
+                city = parts[0]
+                if state:
+                    by_city_state.setdefault((city, state), (lat, lon, name))
+                    state_points.setdefault(state, []).append((lat, lon))
+                by_city.setdefault(city, (lat, lon, name))
+            self._places = by_city_state, by_city, state_points
+        return self._places
+
+    def _state_bounds(self):
+        """State -> (min_lat, max_lat, min_lon, max_lon) of its posting places, padded."""
+        return {
+            state: (
+                min(p[0] for p in pts) - STATE_BOUNDS_MARGIN, max(p[0] for p in pts) + STATE_BOUNDS_MARGIN,
+                min(p[1] for p in pts) - STATE_BOUNDS_MARGIN, max(p[1] for p in pts) + STATE_BOUNDS_MARGIN,
+            )
+            for state, pts in self._posting_places()[2].items()
+        }
+
+    @staticmethod
+    def _in_state(bounds, state, lat, lon):
+        b = bounds[state]
+        return b[0] <= lat <= b[1] and b[2] <= lon <= b[3]
+
+    @staticmethod
+    def _split_area_name(name):
+        """Split "Allentown-Bethlehem-Easton, PA-NJ" into normalized city and state names."""
+        if "," not in name:
+            return [], []
+        cities, codes = name.rsplit(",", 1)
+        states = [ABBR_STATE[c] for c in codes.strip().lower().split("-") if c in ABBR_STATE]
+        return [_normalize_place(c) for c in cities.split("-")], states
+
+    def _fix_area_coords(self, df):
+        """
+        Move area centroids that lie outside every one of their states to the
+        principal city's posting coordinates; drop them when there are none.
+        """
+        by_city_state = self._posting_places()[0]
+        bounds = self._state_bounds()
+
+        rows, fixed, dropped = [], 0, 0
+        for name, lat, lon in df[["name", "lat", "lon"]].itertuples(index=False):
+            cities, states = self._split_area_name(name)
+            known = [s for s in states if s in bounds]
+            if known and not any(self._in_state(bounds, s, lat, lon) for s in known):
+                place = by_city_state.get((cities[0], states[0]))
+                if place is None:
+                    dropped += 1
+                    continue
+                lat, lon, fixed = place[0], place[1], fixed + 1
+            rows.append((name, lat, lon))
+        if fixed or dropped:
+            print(f"⚠️ Area centroids outside their state: {fixed} moved, {dropped} dropped")
+        return pd.DataFrame(rows, columns=["name", "lat", "lon"])
+
+    @property
+    def area_index(self):
+        if self._area_index is None:
+            areas = self._load_areas()
+            self._area_index = SpatialIndex(zip(areas["lat"], areas["lon"]), areas["name"])
+        return self._area_index
+
+    @property
+    def posting_index(self):
+        if self._posting_index is None:
+            postings = self._load_postings()
+            self._posting_index = SpatialIndex(zip(postings["lat"], postings["lon"]), postings["name"])
+        return self._posting_index
+
+    # ---------------------------
+    # Offline geocoding
+    # ---------------------------
+    def _build_gazetteer(self):
+        """
+        Map (city, state) / city / state keys to coordinates. Posting places
+        come first; BLS areas only fill in names the postings lack, such as
+        the secondary cities of a metro area.
+        """
+        posting_city_state, posting_city, state_points = self._posting_places()
+        by_city_state, by_city = dict(posting_city_state), dict(posting_city)
+        bounds = self._state_bounds()
+
+        # BLS areas: "Albany-Schenectady-Troy, NY" or "Allentown-Bethlehem-Easton, PA-NJ"
+        for name, lat, lon in self._load_areas().itertuples(index=False):
+            cities, states = self._split_area_name(name)
+            for city in cities:
+                by_city.setdefault(city, (lat, lon, name))
+                for state in states:
+                    # A bare posting name inside the state ("Chicago") beats the metro centroid
+                    place = posting_city.get(city)
+                    if place is None or state not in bounds or not self._in_state(bounds, state, *place[:2]):
+                        place = (lat, lon, name)
+                    by_city_state.setdefault((city, state), place)
+
+        by_state = {
+            state: (
+                sum(p[0] for p in pts) / len(pts),
+                sum(p[1] for p in pts) / len(pts),
+                state.title(),
+            )
+            for state, pts in state_points.items()
+        }
+        return by_city_state, by_city, by_state
+
+    def geocode(self, location):
+        """
+        Resolve a free-text profile location ("Greater Boston Area",
+        "Austin, Texas, United States") to (lat, lon, matched_name), or None.
+        """
+        if not location or location == "N/A":
+            return None
+        if self._gazetteer is None:
+            self._gazetteer = self._build_gazetteer()
+        by_city_state, by_city, by_state = self._gazetteer
+
+        parts = [
+            _normalize_place(_LOCATION_NOISE.sub(" ", p))
+            for p in _normalize_place(location).split(",")
+        ]
+        parts = [p for p in parts if p]
+        if not parts:
+            return None
+
+        state = None
+        for p in parts[1:]:
+            if p in STATE_NAMES:
+                state = p
+            elif p in ABBR_STATE:
+                state = ABBR_STATE[p]
+
+        city = parts[0]
+        candidates = [city]
+        if city.endswith(" city"):
+            candidates.append(city[: -len(" city")])
+        # "Raleigh-Durham-Chapel Hill" style metro names
+        candidates += [c.strip() for c in city.split("-") if c.strip() and c.strip() != city]
+
+        # A bare state name ("Washington") should not resolve to a same-named town
+        if len(parts) == 1 and city in by_state:
+            return by_state[city]
+
+        for c in candidates:
+            if state and (c, state) in by_city_state:
+                return by_city_state[(c, state)]
+        for c in candidates:
+            if c in by_city:
+                return by_city[c]
+        if state in by_state:
+            return by_state[state]
+        return None
+
+    # ---------------------------
+    # Queries
+    # ---------------------------
+    def postings_near(self, lat, lon, radius_miles=50):
+        """Posting locations within radius_miles, nearest first."""
+        return self.posting_index.within_radius(lat, lon, radius_miles)
+
+    def nearest_postings(self, lat, lon, k=5):
+        return self.posting_index.nearest(lat, lon, k)
+
+    def occupation_index(self, occupation, load_area_df):
+        """
+        KD-tree over the BLS areas that employ `occupation`.
+        load_area_df(occupation) returns the occupation's AREA_TITLE/TOT_EMP
+        rows, normally pre-aggregated by prerender.py; it is only called on a
+        cache miss, so it runs once per occupation rather than once per request.
+        """
+        if occupation not in self._occupation_indexes:
+            areas = self._load_areas()
+            area_df = load_area_df(occupation)
+            df = area_df.assign(TOT_EMP=pd.to_numeric(area_df["TOT_EMP"], errors="coerce").fillna(0))
+            employment = df[df["TOT_EMP"] > 0].groupby("AREA_TITLE")["TOT_EMP"].sum()
+            matched = areas[areas["name"].isin(employment.index)]
+            payloads = [(name, int(employment[name])) for name in matched["name"]]
+            self._occupation_indexes[occupation] = SpatialIndex(
+                zip(matched["lat"], matched["lon"]), payloads
+            )
+        return self._occupation_indexes[occupation]
+
+    def occupation_areas_near(self, occupation, load_area_df, lat, lon, k=5, radius_miles=None):
+        """
+        Nearest areas employing `occupation` as a DataFrame of
+        AREA_TITLE, DISTANCE_MI and TOT_EMP. With radius_miles, every area in
+        range is returned instead of the k nearest.
+        """
+        index = self.occupation_index(occupation, load_area_df)
+        hits = (
+            index.within_radius(lat, lon, radius_miles)
+            if radius_miles is not None else index.nearest(lat, lon, k)
+        )
+        return pd.DataFrame(
+            [(name, round(dist, 1), jobs) for dist, (name, jobs) in hits],
+            columns=["AREA_TITLE", "DISTANCE_MI", "TOT_EMP"],
+        )
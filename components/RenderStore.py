@@ -0,0 +1,146 @@
+# components/RenderStore.py
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import zlib
+
+from components.DataAndModelInitializer import NATIONAL_DATA_PATH, GEO_DATA_PATH
+from components.file_utils import file_version
+
+RENDER_STORE_PATH = "render_cache/renders.sqlite"
+
+# Bump when the rendering code changes so every entry is refreshed
+RENDER_VERSION = "1"
+
+
+def salary_key(title):
+    return f"salary:{title}"
+
+
+def map_key(title):
+    return f"map:{title}"
+
+
+def areas_key(title):
+    return f"areas:{title}"
+
+
+def rows_version(df):
+    """Fingerprint of the source rows an entry is rendered from."""
+    digest = hashlib.sha1(RENDER_VERSION.encode("utf-8"))
+    digest.update(df.to_csv(index=False).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=1)
+def render_versions():
+    """
+    Current source versions: {"salary": ..., "map": ..., "areas": ...}.
+    Hashing the source files is done once per process; entries last checked
+    against any other source version are stale.
+    """
+    return {
+        "salary": f"{RENDER_VERSION}:{file_version(NATIONAL_DATA_PATH)}",
+        "map": f"{RENDER_VERSION}:{file_version(GEO_DATA_PATH)}",
+        "areas": f"{RENDER_VERSION}:{file_version(GEO_DATA_PATH)}",
+    }
+
+
+class RenderStore:
+    """
+    Keyed on-disk store of pre-rendered results (see prerender.py).
+
+    Each entry is zlib-compressed JSON tagged with two versions: `version`,
+    a fingerprint of the rows it was rendered from (see rows_version), and
+    `source`, the source file version it was last checked against. When a
+    data file changes, entries whose rows are unchanged only get their
+    source updated, so only the affected occupations are re-rendered.
+    Reads never create the database; a missing store or a stale entry simply
+    returns None and the app falls back to live rendering.
+    """
+
+    def __init__(self, path=RENDER_STORE_PATH):
+        self.path = path
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(renders)")]
+        if columns and "source" not in columns:
+            # Store written before per-entry fingerprints; it is only a cache
+            conn.execute("DROP TABLE renders")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS renders "
+            "(key TEXT PRIMARY KEY, version TEXT NOT NULL, source TEXT NOT NULL, data BLOB NOT NULL)"
+        )
+        return conn
+
+    def get(self, key, source=None):
+        """Return the decoded entry for key, or None if absent or not checked against `source`."""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            try:
+                row = conn.execute(
+                    "SELECT source, data FROM renders WHERE key = ?", (key,)
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print("Warning: Could not read render store:", e)
+            return None
+        if row is None or (source is not None and row[0] != source):
+            return None
+        return json.loads(zlib.decompress(row[1]))
+
+    def versions(self):
+        """Return {key: (version, source)} for every stored entry."""
+        if not os.path.exists(self.path):
+            return {}
+        conn = self._connect()
+        try:
+            return {
+                key: (version, source)
+                for key, version, source in conn.execute("SELECT key, version, source FROM renders")
+            }
+        finally:
+            conn.close()
+
+    def put_many(self, entries):
+        """Insert or replace (key, version, source, obj) entries in one transaction."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        rows = [
+            (key, version, source, zlib.compress(json.dumps(obj).encode("utf-8"), 9))
+            for key, version, source, obj in entries
+        ]
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO renders (key, version, source, data) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        finally:
+            conn.close()
+
+    def touch_many(self, touched):
+        """Record (key, source) for entries whose rows are unchanged in `source`."""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "UPDATE renders SET source = ? WHERE key = ?", [(s, k) for k, s in touched]
+                )
+        finally:
+            conn.close()
+
+    def delete_many(self, keys):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany("DELETE FROM renders WHERE key = ?", [(k,) for k in keys])
+        finally:
+            conn.close()
@@ -0,0 +1,297 @@
+# components/SkillExtractor.py
+
+import os
+import pickle
+import re
+from collections import Counter, deque
+
+from components.file_utils import file_version
+
+TECH_SKILLS_PATH = "project_data/ONET_extra/Technology Skills.xlsx"
+SKILL_CACHE_PATH = "cache/skill_automaton.pkl"
+
+# Bump when alias generation or the automaton layout changes
+AUTOMATON_VERSION = "4"
+
+# Plain-English O*NET text used to tell everyday words from product names
+PROSE_PATHS = [
+    "project_data/ONET_data/Task Statements.txt",
+    "project_data/ONET_data/Occupation Data.txt",
+]
+
+# Common English words; a vendor-stripped alias in this list ("Excel" from
+# "Microsoft Excel") only matches capitalized, so "I excel at" is not a skill
+ENGLISH_WORDS_PATH = "project_data/english_word_freq.txt"
+
+# A single-token alias that is an everyday word is dropped when it is spread
+# across this many examples ("Design", "Studio") or this common in prose ("Teams")
+MANY_EXAMPLES = 2
+COMMON_USAGE = 10
+
+_TOKEN = re.compile(r"[A-Za-z0-9+#.\-]+")
+
+
+def _collapse(text):
+    return re.sub(r"\s+", " ", str(text)).strip()
+
+
+def _lower_same_length(text):
+    """Lowercase without changing string length, so match offsets stay valid."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+def _initials_acronym(words, i):
+    """True if words[i] is an acronym of the words right before it ("Structured query language SQL")."""
+    token = words[i]
+    if not (3 <= len(token) <= 6 and token.isupper() and token.isalpha()) or i < len(token):
+        return False
+    return "".join(w[0] for w in words[i - len(token):i]).upper() == token
+
+
+def read_common_words(path=ENGLISH_WORDS_PATH):
+    """Set of lowercase words from a one-word-per-line frequency list."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {w.strip().lower() for w in f if w.strip() and not w.startswith("#")}
+    except OSError as e:
+        print("Warning: Could not read English word list:", e)
+        return set()
+
+
+def _token_counts(examples, prose):
+    """
+    Return (usage, spread): how often each word is written in lowercase, i.e.
+    as an ordinary word, across prose and vocabulary text, and how many
+    distinct examples contain it in any case.
+    """
+    usage, spread = Counter(), Counter()
+    for text in list(prose) + list(examples):
+        usage.update(t.strip(".-") for t in _TOKEN.findall(text) if t.islower())
+    for e in examples:
+        spread.update({t.lower().strip(".-") for t in _TOKEN.findall(e)})
+    return usage, spread
+
+
+def build_aliases(examples, prose=(), common_words=frozenset()):
+    """
+    Map each O*NET example to the surface forms a resume is likely to use.
+    Returns [(alias, canonical, case_sensitive), ...]. Single-token aliases
+    that are everyday words spread over many examples ("Askia Design",
+    "Timpani Email" -> "Design", "Email") are dropped; the remaining ones are
+    case-sensitive only if they are also ordinary words, either in O*NET
+    prose ("Spark") or, for vendor-stripped aliases, in common_words
+    ("Excel"). "python" or "Jira" still match. An alias shared by several
+    examples goes to the one listed for most occupations.
+    """
+    counts = Counter(_collapse(e) for e in examples if _collapse(e))
+    examples = sorted(counts)
+    usage, spread = _token_counts(examples, prose)
+
+    def generic(token):
+        word = token.lower()
+        return usage[word] > 0 and (spread[word] >= MANY_EXAMPLES or usage[word] >= COMMON_USAGE)
+
+    # Vendors: capitalized first words that prefix several products
+    first_words = {}
+    for e in examples:
+        words = e.split(" ")
+        if len(words) > 1 and words[0][:1].isupper() and words[1][:1].isupper():
+            first_words[words[0]] = first_words.get(words[0], 0) + 1
+    vendors = {w for w, n in first_words.items() if n >= 3}
+
+    aliases = {}
+
+    def add(alias, canonical, vendor_stripped=False):
+        if len(alias) < 2:
+            return
+        single = " " not in alias
+        if single and generic(alias):
+            return
+        # Everyday words that survive ("Spark", "Excel") only match in their listed case
+        word = alias.lower()
+        case_sensitive = single and (usage[word] > 0 or (vendor_stripped and word in common_words))
+        key = (alias if case_sensitive else alias.lower(), case_sensitive)
+        current = aliases.get(key)
+        if current is None or (-counts[canonical], len(canonical)) < (-counts[current], len(current)):
+            aliases[key] = canonical
+
+    for e in examples:
+        words = e.split(" ")
+        add(e, e)
+        if len(words) > 1 and words[0] in vendors and words[1][:1].isupper():
+            add(" ".join(words[1:]), e, vendor_stripped=True)
+        for i in range(len(words)):
+            if _initials_acronym(words, i):
+                add(words[i], e)
+
+    return [(alias, canonical, cs) for (alias, cs), canonical in aliases.items()]
+
+
+class SkillExtractor:
+    """
+    Aho-Corasick automaton over the O*NET Technology Skills vocabulary.
+
+    All aliases are matched in a single pass over the lowercased text, so the
+    cost is linear in the resume length whatever the vocabulary size. Hits
+    must sit on word boundaries, overlapping hits keep the longest, and the
+    compiled automaton is pickled to SKILL_CACHE_PATH, keyed on the source
+    files' content hashes. prerender.py builds it ahead of time.
+    """
+
+    def __init__(self, vocab_path=TECH_SKILLS_PATH, cache_path=SKILL_CACHE_PATH):
+        self.vocab_path = vocab_path
+        self.cache_path = cache_path
+        self._goto = None
+        self._fail = None
+        self._out = None
+        self._patterns = None
+        self._load()
+
+    # ---------------------------
+    # Vocabulary / cache
+    # ---------------------------
+    def _read_vocabulary(self):
+        """Return (examples, prose): the skill terms and plain-English O*NET text."""
+        try:
+            import pandas as pd
+
+            df = pd.read_excel(self.vocab_path, usecols=["Example", "Commodity Title"])
+            examples = df["Example"].dropna().astype(str).tolist()
+            prose = df["Commodity Title"].dropna().astype(str).unique().tolist()
+            print(f"✅ Technology skills loaded: {len(set(examples)):,} terms")
+        except Exception as e:
+            print("❌ Error loading technology skills:", e)
+            return [], []
+
+        for path in PROSE_PATHS:
+            try:
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    prose.extend(f.read().splitlines()[1:])
+            except OSError as e:
+                print("Warning: Could not read O*NET prose:", e)
+        return examples, prose
+
+    def _load(self):
+        version = ":".join(
+            [AUTOMATON_VERSION, file_version(self.vocab_path), file_version(ENGLISH_WORDS_PATH)]
+            + [file_version(p) for p in PROSE_PATHS]
+        )
+        try:
+            with open(self.cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if cached["version"] == version:
+                self._goto, self._fail, self._out, self._patterns = cached["automaton"]
+                return
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, ValueError):
+            pass
+
+        self._build(build_aliases(*self._read_vocabulary(), read_common_words()))
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(self.cache_path, "wb") as f:
+                pickle.dump(
+                    {"version": version,
+                     "automaton": (self._goto, self._fail, self._out, self._patterns)},
+                    f, protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        except OSError as e:
+            print("Warning: Could not cache skill automaton:", e)
+
+    @classmethod
+    def from_vocabulary(cls, examples, prose=(), common_words=frozenset()):
+        """Build an uncached extractor from in-memory terms."""
+        extractor = cls.__new__(cls)
+        extractor.vocab_path = extractor.cache_path = None
+        extractor._build(build_aliases(examples, prose, common_words))
+        return extractor
+
+    # ---------------------------
+    # Automaton construction
+    # ---------------------------
+    def _build(self, aliases):
+        goto, out = [{}], [[]]
+        self._patterns = []
+        for alias, canonical, case_sensitive in aliases:
+            state = 0
+            for ch in _lower_same_length(alias):
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(len(self._patterns))
+            self._patterns.append((alias, canonical, case_sensitive, len(alias)))
+
+        # Breadth-first failure links; outputs inherit from their fail state
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto, self._fail = goto, fail
+        self._out = [tuple(o) for o in out]
+
+    # ---------------------------
+    # Matching
+    # ---------------------------
+    def find(self, text):
+        """Return [(start, end, canonical), ...] non-overlapping, longest first."""
+        text = _collapse(text)
+        lowered = _lower_same_length(text)
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self._patterns
+
+        hits = []
+        state = 0
+        for i, ch in enumerate(lowered):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pid in out[state]:
+                alias, canonical, case_sensitive, length = patterns[pid]
+                start, end = i - length + 1, i + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if end < len(text) and text[end].isalnum():
+                    continue
+                if case_sensitive and text[start:end] != alias:
+                    continue
+                hits.append((start, end, canonical))
+
+        # Keep the longest hit among overlapping ones
+        hits.sort(key=lambda h: (h[0], -(h[1] - h[0])))
+        selected, last_end = [], -1
+        for start, end, canonical in hits:
+            if start >= last_end:
+                selected.append((start, end, canonical))
+                last_end = end
+            elif end - start > selected[-1][1] - selected[-1][0]:
+                selected[-1] = (start, end, canonical)
+                last_end = end
+        return selected
+
+    def extract(self, text):
+        """Return the sorted, de-duplicated skill names found in text."""
+        return sorted({canonical for _, _, canonical in self.find(text)})
+
+
+_default_extractor = None
+
+
+def get_skill_extractor():
+    """Shared SkillExtractor, built (or loaded from cache) on first use."""
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = SkillExtractor()
+    return _default_extractor
@@ -0,0 +1,120 @@
+# components/SpatialIndex.py
+
+import heapq
+import math
+
+EARTH_RADIUS_MILES = 3958.8
+
+
+def _to_xyz(lat, lon):
+    """Project a lat/lon pair onto the unit sphere."""
+    lat, lon = math.radians(lat), math.radians(lon)
+    cos_lat = math.cos(lat)
+    return (cos_lat * math.cos(lon), cos_lat * math.sin(lon), math.sin(lat))
+
+
+def _chord_to_miles(chord):
+    return 2 * EARTH_RADIUS_MILES * math.asin(min(1.0, chord / 2))
+
+
+def _miles_to_chord(miles):
+    return 2 * math.sin(min(math.pi, miles / EARTH_RADIUS_MILES) / 2)
+
+
+class SpatialIndex:
+    """
+    Static KD-tree over lat/lon points for radius and k-nearest queries.
+
+    Points are stored as 3D unit vectors, so straight-line (chord) distance
+    orders points exactly like great-circle distance and no longitude
+    wrap-around handling is needed. Results are returned in miles.
+    """
+    LEAF_SIZE = 16
+
+    def __init__(self, coords, payloads=None):
+        coords = list(coords)
+        self._xyz = [_to_xyz(lat, lon) for lat, lon in coords]
+        self._payloads = list(payloads) if payloads is not None else list(range(len(coords)))
+        if len(self._payloads) != len(self._xyz):
+            raise ValueError("coords and payloads must have the same length")
+        self._root = self._build(list(range(len(self._xyz)))) if self._xyz else None
+
+    def __len__(self):
+        return len(self._xyz)
+
+    # ---------------------------
+    # Construction
+    # ---------------------------
+    def _build(self, idxs):
+        if len(idxs) <= self.LEAF_SIZE:
+            return idxs
+
+        # Split on the axis with the largest spread
+        xyz = self._xyz
+        spreads = [
+            max(xyz[i][a] for i in idxs) - min(xyz[i][a] for i in idxs) for a in range(3)
+        ]
+        axis = spreads.index(max(spreads))
+        idxs.sort(key=lambda i: xyz[i][axis])
+        mid = len(idxs) // 2
+        return (axis, xyz[idxs[mid]][axis], self._build(idxs[:mid]), self._build(idxs[mid:]))
+
+    # ---------------------------
+    # Queries
+    # ---------------------------
+    def within_radius(self, lat, lon, radius_miles):
+        """Return [(distance_miles, payload), ...] within radius, nearest first."""
+        if self._root is None:
+            return []
+        q = _to_xyz(lat, lon)
+        limit = _miles_to_chord(radius_miles) ** 2
+        xyz = self._xyz
+        hits = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                for i in node:
+                    p = xyz[i]
+                    d2 = (p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2 + (p[2] - q[2]) ** 2
+                    if d2 <= limit:
+                        hits.append((d2, i))
+                continue
+            axis, split, left, right = node
+            diff = q[axis] - split
+            near, far = (left, right) if diff < 0 else (right, left)
+            stack.append(near)
+            if diff * diff <= limit:
+                stack.append(far)
+
+        hits.sort()
+        return [(_chord_to_miles(math.sqrt(d2)), self._payloads[i]) for d2, i in hits]
+
+    def nearest(self, lat, lon, k=5):
+        """Return the k nearest [(distance_miles, payload), ...], nearest first."""
+        if self._root is None or k <= 0:
+            return []
+        q = _to_xyz(lat, lon)
+        xyz = self._xyz
+        heap = []  # max-heap of (-d2, i) holding the best k so far
+
+        def visit(node):
+            if isinstance(node, list):
+                for i in node:
+                    p = xyz[i]
+                    d2 = (p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2 + (p[2] - q[2]) ** 2
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-d2, i))
+                    elif d2 < -heap[0][0]:
+                        heapq.heapreplace(heap, (-d2, i))
+                return
+            axis, split, left, right = node
+            diff = q[axis] - split
+            near, far = (left, right) if diff < 0 else (right, left)
+            visit(near)
+            if len(heap) < k or diff * diff < -heap[0][0]:
+                visit(far)
+
+        visit(self._root)
+        best = sorted((-neg_d2, i) for neg_d2, i in heap)
+        return [(_chord_to_miles(math.sqrt(d2)), self._payloads[i]) for d2, i in best]
@@ -0,0 +1,15 @@
+# components/file_utils.py
+
+import hashlib
+import os
+
+
+def file_version(path):
+    """Content hash of a source data file, or 'missing' when it is absent."""
+    if not os.path.exists(path):
+        return "missing"
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
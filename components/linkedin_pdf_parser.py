@@ -1,9 +1,12 @@
-import pdfplumber
 import re
 from statistics import mean
 
+from components.SkillExtractor import get_skill_extractor
+
 def extract_linkedin_info(pdf_path):
     try:
+        import pdfplumber
+
         with pdfplumber.open(pdf_path) as pdf:
             text = "\n".join(page.extract_text() or "" for page in pdf.pages)
 
@@ -83,11 +86,8 @@ def extract_linkedin_info(pdf_path):
         if not experience:
             experience = section_between("experience")
 
-        # --- Skills: find known tech keywords ---
-        tech_keywords = ["python","java","react","node","sql","docker","aws","kubernetes",
-                         "javascript","typescript","machine learning","ai","flask","django","graphql"]
-        found_skills = [kw.capitalize() for kw in tech_keywords if kw in text_lower]
-        skills = ", ".join(sorted(set(found_skills)))
+        # --- Skills: O*NET Technology Skills terms, one automaton pass ---
+        skills = ", ".join(get_skill_extractor().extract(text))
 
         return {
             "name": full_name.strip(),
@@ -0,0 +1,237 @@
+"""
+Pre-render salary charts, state map payloads and per-area employment for
+every occupation.
+
+The set of possible matches is finite (every row of the national dataset),
+so each occupation's salary figure, per-state employment payload and
+per-area (AREA_TITLE, TOT_EMP) totals for the "jobs near you" lookup are
+rendered in a process pool and written to the RenderStore. The app serves
+these directly and only renders live, or reads the geographic file, when an
+entry is missing or stale.
+
+Runs are incremental: each entry is tagged with a fingerprint of the rows it
+was rendered from (the occupation's national row plus "All Occupations" for
+salary charts, its state rows for maps, its area rows for area totals).
+When a data file changes, only the occupations whose rows changed are
+re-rendered; the rest are just marked as current. The skill extractor's
+automaton cache is built here as well. Run it as a build step after the data
+files change.
+
+Usage:
+    python prerender.py [--workers N] [--force] [--store PATH]
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from components.DataAndModelInitializer import DataAndModelInitializer
+from components.RenderStore import (
+    RenderStore, RENDER_STORE_PATH, render_versions, rows_version, salary_key, map_key, areas_key
+)
+from components.SkillExtractor import get_skill_extractor
+from components.VisualizationTools import VisualizationTools
+
+BATCH_SIZE = 50
+
+STORE_KEYS = {"salary": salary_key, "map": map_key, "areas": areas_key}
+GEO_KINDS = ("map", "areas")
+
+# Per-worker state, set once by _init_worker instead of pickled per task
+_job_df = None
+_state_df = None
+_area_rows = None
+_viz_tools = None
+
+
+def _init_worker(job_df, state_df, area_rows):
+    global _job_df, _state_df, _area_rows, _viz_tools
+    _job_df, _state_df, _area_rows = job_df, state_df, area_rows
+    _viz_tools = VisualizationTools()
+
+
+def group_area_rows(geo_df):
+    """{lowercased occupation title: its AREA_TITLE/TOT_EMP rows} over every area."""
+    titles = geo_df["OCC_TITLE"].str.strip().str.lower()
+    return {
+        title: rows.reset_index(drop=True)
+        for title, rows in geo_df[["AREA_TITLE", "TOT_EMP"]].groupby(titles)
+    }
+
+
+def salary_rows(job_df, title):
+    """The occupation's national row plus the "All Occupations" row."""
+    names = job_df["Occupation"].str.strip().str.lower()
+    return job_df[names.isin([title.strip().lower(), "all occupations"])]
+
+
+def map_rows(state_df, title):
+    """The occupation's state-level rows."""
+    return DataAndModelInitializer.filter_geographic_job_data(state_df, title)
+
+
+def area_rows(grouped, title):
+    """The occupation's rows for every area, matched on the exact title."""
+    rows = grouped.get(title.strip().lower())
+    return rows if rows is not None else pd.DataFrame(columns=["AREA_TITLE", "TOT_EMP"])
+
+
+def render_salary(viz_tools, rows, title):
+    fig, role_salary, national_salary = viz_tools.salary_figure(rows, title)
+    return {
+        "figure": json.loads(fig.to_json()) if fig is not None else None,
+        "role_salary": float(role_salary) if role_salary is not None else None,
+        "national_salary": float(national_salary) if national_salary is not None else None,
+    }
+
+
+def render_map(viz_tools, rows, title):
+    payload = viz_tools.build_state_payload(rows, title) if not rows.empty else None
+    return {"payload": payload}
+
+
+def render_areas(viz_tools, rows, title):
+    employment = pd.to_numeric(rows["TOT_EMP"], errors="coerce").fillna(0)
+    totals = employment[employment > 0].groupby(rows["AREA_TITLE"]).sum()
+    return {"areas": [[area, int(jobs)] for area, jobs in totals.items()]}
+
+
+def _render_task(title, jobs):
+    """
+    Check the artifacts of one occupation in a worker process.
+    jobs is [(kind, source, stored_version)]. An artifact whose rows still
+    match stored_version is only touched; the others are re-rendered.
+    Returns (entries, touched, errors); a failing artifact is reported, not
+    raised, so one bad title does not abort the run.
+    """
+    entries, touched, errors = [], [], []
+    for kind, source, stored_version in jobs:
+        key = STORE_KEYS[kind](title)
+        try:
+            if kind == "salary":
+                rows, render = salary_rows(_job_df, title), render_salary
+            elif kind == "map":
+                rows, render = map_rows(_state_df, title), render_map
+            else:
+                rows, render = area_rows(_area_rows, title), render_areas
+            version = rows_version(rows)
+            if version == stored_version:
+                touched.append((key, source))
+            else:
+                entries.append((key, version, source, render(_viz_tools, rows, title)))
+        except Exception as e:
+            errors.append(f"{key}: {e}")
+    return entries, touched, errors
+
+
+def plan_tasks(titles, existing, sources, force=False):
+    """
+    Return [(title, jobs)] for every occupation with an artifact to check.
+    An artifact is checked when its entry is missing or was last checked
+    against another source version; with force its fingerprint is ignored.
+    """
+    tasks = []
+    for title in titles:
+        jobs = []
+        for kind, source in sources.items():
+            stored_version, stored_source = existing.get(STORE_KEYS[kind](title), (None, None))
+            if force or stored_source != source:
+                jobs.append((kind, source, None if force else stored_version))
+        if jobs:
+            tasks.append((title, jobs))
+    return tasks
+
+
+def update_store(store, job_df, load_geo_df, sources, force=False, workers=None):
+    """
+    Bring `store` up to date with `sources` ({kind: source version}) for every
+    occupation in job_df. load_geo_df() returns every area's rows and is only
+    called when map or area entries need checking. Returns (rendered,
+    touched, failed) counts.
+    """
+    titles = job_df["Occupation"].tolist()
+    existing = store.versions()
+    tasks = plan_tasks(titles, existing, sources, force)
+
+    # Drop entries for occupations no longer in the dataset (and map / area
+    # entries rendered from a source that is now missing)
+    wanted = {STORE_KEYS[kind](t) for kind in sources for t in titles}
+    removed = [k for k in existing if k not in wanted]
+    if removed:
+        store.delete_many(removed)
+
+    print(f"🧮 {len(titles)} occupations, {len(tasks)} to check, {len(removed)} removed")
+    if not tasks:
+        return 0, 0, 0
+
+    # The geographic file is only read when map or area entries need checking
+    state_df, grouped = None, None
+    if any(kind in GEO_KINDS for _, jobs in tasks for kind, _, _ in jobs):
+        geo_df = load_geo_df()
+        state_df = DataAndModelInitializer.filter_geographic_job_data(geo_df)
+        grouped = group_area_rows(geo_df)
+
+    done, rendered, n_touched, failed = 0, 0, 0, 0
+    batch, touched = [], []
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(job_df, state_df, grouped)
+        ) as pool:
+            futures = {pool.submit(_render_task, *task): task[0] for task in tasks}
+            for future in as_completed(futures):
+                done += 1
+                try:
+                    entries, unchanged, errors = future.result()
+                except Exception as e:
+                    entries, unchanged, errors = [], [], [f"{futures[future]}: {e}"]
+                for error in errors:
+                    failed += 1
+                    print(f"❌ Render failed for {error}")
+                rendered += len(entries)
+                n_touched += len(unchanged)
+                batch.extend(entries)
+                touched.extend(unchanged)
+                if len(batch) + len(touched) >= BATCH_SIZE:
+                    store.put_many(batch)
+                    store.touch_many(touched)
+                    batch, touched = [], []
+                    print(f"   {done}/{len(tasks)} occupations checked")
+    finally:
+        # Keep whatever was rendered even if the run is interrupted
+        if batch:
+            store.put_many(batch)
+        if touched:
+            store.touch_many(touched)
+
+    return rendered, n_touched, failed
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render results for every occupation")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument("--force", action="store_true", help="Re-render every entry")
+    parser.add_argument("--store", default=RENDER_STORE_PATH, help="Render store path")
+    args = parser.parse_args()
+
+    # Build (or refresh) the cached skill automaton so no request pays for it
+    get_skill_extractor()
+
+    sources = dict(render_versions())
+    # Without the geographic file there is nothing to pre-render for the map
+    # or areas; storing empty payloads would block the app's live fallback
+    if sources["map"].endswith(":missing"):
+        for kind in GEO_KINDS:
+            del sources[kind]
+        print("⚠️ Geographic dataset missing: skipping map and area entries")
+
+    loader = DataAndModelInitializer()
+    rendered, touched, failed = update_store(
+        RenderStore(args.store), loader.load_job_data(), loader.load_all_area_job_data,
+        sources, force=args.force, workers=args.workers,
+    )
+    print(f"✅ Render store updated: {args.store} ({rendered} rendered, {touched} unchanged, {failed} failed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Startup report: import-time breakdown for app.py.
+
+Runs `python -X importtime -c "import app"` in a fresh interpreter, groups the
+per-module import times by top-level package and appends one JSON line per run
+to reports/startup_times.jsonl so the numbers can be tracked across deploys.
+
+Usage:
+    python startup_report.py [--top 15] [--no-save]
+"""
+import argparse
+import datetime
+import json
+import os
+import subprocess
+import sys
+import time
+
+REPORT_DIR = "reports"
+REPORT_FILE = os.path.join(REPORT_DIR, "startup_times.jsonl")
+
+
+def run_importtime(target="app"):
+    """Import `target` in a subprocess and return (wall_seconds, stderr_lines)."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"Importing {target} failed: {tail[0]}")
+    return wall, proc.stderr.splitlines()
+
+
+def parse_importtime(lines):
+    """
+    Aggregate `-X importtime` output by top-level package.
+    Each module's self time is charged to its top-level package, so nested
+    imports are attributed to the package that owns them without double counting.
+    """
+    totals = {}
+    for line in lines:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            head, _, name = line.split("|", 2)
+            self_us = int(head.split(":", 1)[1].strip())
+        except ValueError:
+            continue
+        package = name.strip().split(".")[0]
+        totals[package] = totals.get(package, 0) + self_us
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report import time of app.py")
+    parser.add_argument("--top", type=int, default=15, help="Number of packages to print")
+    parser.add_argument("--no-save", action="store_true", help="Do not append to the report file")
+    args = parser.parse_args()
+
+    wall, lines = run_importtime("app")
+    totals = parse_importtime(lines)
+    ranked = sorted(totals.items(), key=lambda kv: kv[1], reverse=True)
+
+    print(f"⏱  app import wall time: {wall:.3f}s")
+    print(f"{'package':<30}{'self ms':>15}")
+    for package, micros in ranked[:args.top]:
+        print(f"{package:<30}{micros / 1000:>15.1f}")
+
+    if not args.no_save:
+        os.makedirs(REPORT_DIR, exist_ok=True)
+        record = {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "wall_s": round(wall, 4),
+            "packages_ms": {pkg: round(us / 1000, 2) for pkg, us in ranked},
+        }
+        with open(REPORT_FILE, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"✅ Appended report to {REPORT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
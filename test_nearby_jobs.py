@@ -0,0 +1,62 @@
+import pandas as pd
+
+from components.NearbyJobs import NearbyJobs
+from test_spatial_index import haversine
+
+NEARBY = NearbyJobs()
+
+
+def assert_near(place, lat, lon, miles=10):
+    assert place is not None
+    assert haversine(place[0], place[1], lat, lon) <= miles, place
+
+
+def test_posting_cities_beat_metro_centroids():
+    assert_near(NEARBY.geocode("Portland, Oregon"), 45.52, -122.67)
+    assert_near(NEARBY.geocode("Chicago, IL"), 41.88, -87.63)
+    assert_near(NEARBY.geocode("Kansas City, Missouri"), 39.10, -94.58)
+
+
+def test_linkedin_style_locations():
+    assert_near(NEARBY.geocode("Greater Boston Area"), 42.36, -71.06)
+    assert_near(NEARBY.geocode("Austin, Texas, United States"), 30.27, -97.74)
+    assert NEARBY.geocode("N/A") is None
+    assert NEARBY.geocode("") is None
+
+
+def test_postings_near_use_exact_city():
+    lat, lon, _ = NEARBY.geocode("Portland, Oregon")
+    assert len(NEARBY.postings_near(lat, lon, radius_miles=50)) >= 40
+    lat, lon, _ = NEARBY.geocode("Chicago, IL")
+    assert len(NEARBY.postings_near(lat, lon, radius_miles=50)) >= 150
+
+
+def test_area_centroids_lie_in_their_state():
+    areas = NEARBY._load_areas().set_index("name")
+    portland = areas.loc["Portland-Vancouver-Hillsboro, OR-WA"]
+    assert_near((portland["lat"], portland["lon"]), 45.52, -122.67, miles=30)
+    bounds = NEARBY._state_bounds()
+    for name, lat, lon in NEARBY._load_areas().itertuples(index=False):
+        _, states = NearbyJobs._split_area_name(name)
+        known = [s for s in states if s in bounds]
+        assert not known or any(NearbyJobs._in_state(bounds, s, lat, lon) for s in known), name
+
+
+def test_occupation_areas_near():
+    area_df = pd.DataFrame({
+        "AREA_TITLE": ["Portland-Vancouver-Hillsboro, OR-WA", "Seattle-Tacoma-Bellevue, WA", "Bend, OR"],
+        "TOT_EMP": ["1200", "3400", "0"],
+    })
+    lat, lon, _ = NEARBY.geocode("Portland, Oregon")
+    nearest = NEARBY.occupation_areas_near("Actors", lambda occ: area_df, lat, lon, k=5)
+    assert nearest["AREA_TITLE"].tolist() == [
+        "Portland-Vancouver-Hillsboro, OR-WA", "Seattle-Tacoma-Bellevue, WA"
+    ]
+    assert nearest["TOT_EMP"].tolist() == [1200, 3400]
+
+
+def test_missing_tables_give_empty_results(tmp_path):
+    nearby = NearbyJobs(area_path=tmp_path / "areas.xlsx", posting_path=tmp_path / "postings.xlsx")
+    assert nearby.geocode("Portland, Oregon") is None
+    assert nearby.postings_near(45.52, -122.67) == []
+    assert nearby.area_index.nearest(45.52, -122.67) == []
@@ -0,0 +1,121 @@
+import pandas as pd
+
+import prerender
+from components.RenderStore import RenderStore, areas_key, map_key, salary_key
+
+SOURCES = {"salary": "1:national-a", "map": "1:geo-a", "areas": "1:geo-a"}
+
+
+def job_df(actor_salary=50000):
+    return pd.DataFrame({
+        "Occupation": ["All Occupations", "Actors", "Chemists"],
+        "Description": ["All Occupations", "Actors", "Chemists"],
+        "A_MEAN": [60000.0, float(actor_salary), 90000.0],
+        "A_MEDIAN": [0.0, 0.0, 0.0],
+        "H_MEAN": [0.0, 0.0, 0.0],
+        "TOT_EMP": [0.0, 0.0, 0.0],
+    })
+
+
+def geo_df(chemists_in_texas=300, chemists_in_austin=80):
+    return pd.DataFrame({
+        "AREA_TITLE": [
+            "California", "Texas", "Los Angeles-Long Beach-Anaheim, CA",
+            "California", "Texas", "Austin-Round Rock-San Marcos, TX",
+        ],
+        "OCC_TITLE": ["Actors", "Actors", "Actors", "Chemists", "Chemists", "Chemists"],
+        "TOT_EMP": [1000.0, 200.0, 700.0, 500.0, float(chemists_in_texas), float(chemists_in_austin)],
+        "H_MEAN": [0.0] * 6,
+    })
+
+
+def update(store, jobs=None, geo=None, sources=SOURCES, force=False):
+    geo = geo_df() if geo is None else geo
+    return prerender.update_store(
+        store, job_df() if jobs is None else jobs, lambda: geo, sources, force=force, workers=1
+    )
+
+
+def test_plan_tasks_checks_missing_and_stale_entries():
+    existing = {
+        salary_key("Actors"): ("fp1", SOURCES["salary"]),
+        map_key("Actors"): ("fp2", "1:geo-old"),
+    }
+    tasks = prerender.plan_tasks(["Actors", "Chemists"], existing, SOURCES)
+    assert tasks == [
+        ("Actors", [("map", SOURCES["map"], "fp2"), ("areas", SOURCES["areas"], None)]),
+        ("Chemists", [(kind, source, None) for kind, source in SOURCES.items()]),
+    ]
+    forced = prerender.plan_tasks(["Actors"], existing, SOURCES, force=True)
+    assert forced == [("Actors", [(kind, source, None) for kind, source in SOURCES.items()])]
+
+
+def test_first_run_renders_everything(tmp_path):
+    store = RenderStore(tmp_path / "renders.sqlite")
+    assert update(store) == (9, 0, 0)
+    assert store.get(salary_key("Actors"), SOURCES["salary"])["role_salary"] == 50000.0
+    payload = store.get(map_key("Chemists"), SOURCES["map"])["payload"]
+    assert dict(zip(payload["states"], payload["jobs"])) == {"CA": 500, "TX": 300}
+    assert store.get(areas_key("Actors"), SOURCES["areas"])["areas"] == [
+        ["California", 1000], ["Los Angeles-Long Beach-Anaheim, CA", 700], ["Texas", 200]
+    ]
+    assert store.get(areas_key("All Occupations"), SOURCES["areas"]) == {"areas": []}
+    assert update(store) == (0, 0, 0)
+
+
+def test_data_update_rerenders_only_changed_occupations(tmp_path):
+    store = RenderStore(tmp_path / "renders.sqlite")
+    update(store)
+    before = store.versions()
+
+    sources = {"salary": "1:national-b", "map": "1:geo-b", "areas": "1:geo-b"}
+    jobs, geo = job_df(actor_salary=55000), geo_df(chemists_in_austin=90)
+    assert update(store, jobs, geo, sources) == (2, 7, 0)
+
+    after = store.versions()
+    changed = {k for k in after if after[k][0] != before[k][0]}
+    assert changed == {salary_key("Actors"), areas_key("Chemists")}
+    assert all(source in sources.values() for _, source in after.values())
+    assert store.get(salary_key("Actors"), sources["salary"])["role_salary"] == 55000.0
+
+
+def test_all_occupations_change_rerenders_every_salary(tmp_path):
+    store = RenderStore(tmp_path / "renders.sqlite")
+    update(store)
+    jobs = job_df()
+    jobs.loc[jobs["Occupation"] == "All Occupations", "A_MEAN"] = 61000.0
+    sources = dict(SOURCES, salary="1:national-b")
+    assert update(store, jobs, sources=sources) == (3, 0, 0)
+
+
+def test_removed_occupations_and_missing_map_source_are_dropped(tmp_path):
+    store = RenderStore(tmp_path / "renders.sqlite")
+    update(store)
+    update(store, job_df().iloc[:2], sources={"salary": SOURCES["salary"]})
+    assert set(store.versions()) == {salary_key("All Occupations"), salary_key("Actors")}
+
+
+def test_geo_rows_are_not_loaded_when_current(tmp_path):
+    store = RenderStore(tmp_path / "renders.sqlite")
+    update(store)
+
+    def fail():
+        raise AssertionError("geographic rows loaded")
+
+    sources = dict(SOURCES, salary="1:national-b")
+    assert prerender.update_store(store, job_df(), fail, sources, workers=1) == (0, 3, 0)
+
+
+def test_app_serves_area_employment_from_store(tmp_path, monkeypatch):
+    import app
+
+    store = RenderStore(tmp_path / "renders.sqlite")
+    update(store)
+    monkeypatch.setattr(app, "render_store", store)
+    monkeypatch.setattr(app, "render_versions", lambda: SOURCES)
+    monkeypatch.setattr(app, "data_loader", None)  # any geographic read would fail
+
+    areas = app.load_area_employment("Chemists")
+    assert areas.values.tolist() == [
+        ["Austin-Round Rock-San Marcos, TX", 80], ["California", 500], ["Texas", 300]
+    ]
@@ -0,0 +1,66 @@
+import sqlite3
+
+import pandas as pd
+
+from components.RenderStore import RenderStore, rows_version
+
+
+def test_get_missing_store_is_a_miss(tmp_path):
+    store = RenderStore(tmp_path / "renders.sqlite")
+    assert store.get("salary:Actors") is None
+    assert store.versions() == {}
+    assert not (tmp_path / "renders.sqlite").exists()
+
+
+def test_put_and_get(tmp_path):
+    store = RenderStore(tmp_path / "renders.sqlite")
+    store.put_many([
+        ("salary:Actors", "v1", "src1", {"role_salary": 1.0}),
+        ("map:Actors", "v2", "src2", {"payload": None}),
+    ])
+    assert store.get("salary:Actors", "src1") == {"role_salary": 1.0}
+    assert store.get("map:Actors", "src2") == {"payload": None}
+    assert store.get("salary:Actors") == {"role_salary": 1.0}
+    assert store.versions() == {"salary:Actors": ("v1", "src1"), "map:Actors": ("v2", "src2")}
+
+
+def test_source_mismatch_is_a_miss(tmp_path):
+    store = RenderStore(tmp_path / "renders.sqlite")
+    store.put_many([("salary:Actors", "v1", "src1", {"role_salary": 1.0})])
+    assert store.get("salary:Actors", "src2") is None
+
+
+def test_touch_marks_entries_current(tmp_path):
+    store = RenderStore(tmp_path / "renders.sqlite")
+    store.put_many([("salary:Actors", "v1", "src1", {"role_salary": 1.0})])
+    store.touch_many([("salary:Actors", "src2")])
+    assert store.get("salary:Actors", "src2") == {"role_salary": 1.0}
+    assert store.versions() == {"salary:Actors": ("v1", "src2")}
+
+
+def test_put_replaces_and_delete_removes(tmp_path):
+    store = RenderStore(tmp_path / "renders.sqlite")
+    store.put_many([("a", "v1", "s", 1), ("b", "v1", "s", 2)])
+    store.put_many([("a", "v2", "s", 3)])
+    assert store.get("a") == 3
+    store.delete_many(["a"])
+    assert store.get("a") is None
+    assert store.versions() == {"b": ("v1", "s")}
+
+
+def test_store_without_source_column_is_rebuilt(tmp_path):
+    path = tmp_path / "renders.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE renders (key TEXT PRIMARY KEY, version TEXT NOT NULL, data BLOB NOT NULL)")
+    conn.commit()
+    conn.close()
+    store = RenderStore(path)
+    assert store.versions() == {}
+    store.put_many([("a", "v1", "s", 1)])
+    assert store.get("a", "s") == 1
+
+
+def test_rows_version_tracks_row_content():
+    df = pd.DataFrame({"Occupation": ["Actors", "All Occupations"], "A_MEAN": [50000, 60000]})
+    assert rows_version(df) == rows_version(df.copy())
+    assert rows_version(df) != rows_version(df.assign(A_MEAN=[50001, 60000]))
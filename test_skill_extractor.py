@@ -0,0 +1,90 @@
+import pytest
+
+from components.SkillExtractor import SkillExtractor, build_aliases
+
+# A small vocabulary with the same shape as O*NET Technology Skills: vendors
+# that prefix several products, some of whose names are everyday words
+EXAMPLES = [
+    "Askia Design", "Askia Web", "Askia Analysis",
+    "Timpani Email", "Timpani Chat", "Timpani Studio",
+    "Adobe Photoshop", "Adobe Illustrator", "Adobe Acrobat",
+    "Google Go", "Google Cloud", "Google Docs",
+    "Microsoft Visual Studio", "Microsoft Teams", "Microsoft Excel",
+    "Atlassian JIRA", "Atlassian Confluence", "Atlassian Bamboo",
+    "Python", "Python", "Kubernetes", "PostgreSQL",
+    "Structured query language SQL", "Slack Chat", "Chat",
+    "Go", "Email", "Design studio",
+]
+
+# Plain-English text in which the generic words are ordinary vocabulary
+PROSE = [
+    "Design graphics and email drafts for the design team.",
+    "Visit client sites and go over the studio layout.",
+    "Answer email requests and chat with customers.",
+]
+
+
+def extractor():
+    return SkillExtractor.from_vocabulary(EXAMPLES, PROSE)
+
+
+def test_generic_single_token_aliases_are_dropped():
+    aliases = {alias for alias, _, _ in build_aliases(EXAMPLES, PROSE)}
+    for word in ["Design", "Email", "Go", "Studio", "Chat"]:
+        assert word not in aliases
+
+
+def test_generic_words_in_prose_are_not_skills():
+    text = "I design email campaigns, go to the studio and chat with clients."
+    assert extractor().extract(text) == []
+
+
+def test_full_product_names_still_match():
+    text = "Built newsletters in Askia Design and Timpani Email, wrote Go code in Google Go."
+    assert extractor().extract(text) == ["Askia Design", "Google Go", "Timpani Email"]
+
+
+def test_distinctive_products_match_without_vendor():
+    text = "Skilled in Photoshop, Confluence and Python."
+    assert extractor().extract(text) == ["Adobe Photoshop", "Atlassian Confluence", "Python"]
+
+
+def test_distinctive_products_match_in_any_case():
+    text = "daily work in python, sql and jira on kubernetes."
+    assert extractor().extract(text) == [
+        "Atlassian JIRA", "Kubernetes", "Python", "Structured query language SQL"
+    ]
+
+
+def test_surviving_everyday_words_keep_their_case():
+    examples = EXAMPLES + ["Apache Spark", "Apache Hive", "Apache Kafka"]
+    prose = PROSE + ["Spark interest in the program; a spark of creativity."]
+    extractor = SkillExtractor.from_vocabulary(examples, prose)
+    assert extractor.extract("ran jobs on Spark") == ["Apache Spark"]
+    assert extractor.extract("a spark of interest") == []
+
+
+def test_vendor_stripped_english_words_need_capitals():
+    extractor = SkillExtractor.from_vocabulary(EXAMPLES, PROSE, {"excel", "python", "sql"})
+    assert extractor.extract("I excel at communication") == []
+    assert extractor.extract("Reports in Excel and python") == ["Microsoft Excel", "Python"]
+
+
+@pytest.fixture(scope="module")
+def onet_extractor(tmp_path_factory):
+    return SkillExtractor(cache_path=tmp_path_factory.mktemp("cache") / "skills.pkl")
+
+
+def test_onet_vocabulary_everyday_words(onet_extractor):
+    assert onet_extractor.extract("I excel at communication") == []
+    assert onet_extractor.extract(
+        "I design email campaigns, go to the studio and chat with a spark of creativity."
+    ) == []
+
+
+def test_onet_vocabulary_products(onet_extractor):
+    text = "Built Excel reports; python, sql, Jira, kubernetes and postgresql daily."
+    assert onet_extractor.extract(text) == [
+        "Atlassian JIRA", "Kubernetes", "Microsoft Excel", "PostgreSQL", "Python",
+        "Structured query language SQL",
+    ]
@@ -0,0 +1,63 @@
+import math
+import random
+
+from components.SpatialIndex import SpatialIndex, EARTH_RADIUS_MILES
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+
+def random_points(n, seed=7):
+    rng = random.Random(seed)
+    return [(rng.uniform(24, 49), rng.uniform(-125, -66)) for _ in range(n)]
+
+
+POINTS = random_points(2000)
+INDEX = SpatialIndex(POINTS)
+QUERIES = random_points(25, seed=11) + [(40.7, -74.0), (47.6, -122.3)]
+
+
+def test_within_radius_matches_brute_force():
+    for lat, lon in QUERIES:
+        for radius in (10, 75, 300):
+            expected = sorted(
+                i for i, (plat, plon) in enumerate(POINTS) if haversine(lat, lon, plat, plon) <= radius
+            )
+            hits = INDEX.within_radius(lat, lon, radius)
+            assert sorted(i for _, i in hits) == expected
+            assert [d for d, _ in hits] == sorted(d for d, _ in hits)
+
+
+def test_nearest_matches_brute_force():
+    for lat, lon in QUERIES:
+        for k in (1, 5, 40):
+            expected = sorted(haversine(lat, lon, plat, plon) for plat, plon in POINTS)[:k]
+            hits = INDEX.nearest(lat, lon, k)
+            assert len(hits) == k
+            for (dist, i), want in zip(hits, expected):
+                assert math.isclose(dist, want, abs_tol=1e-6)
+                assert math.isclose(dist, haversine(lat, lon, *POINTS[i]), abs_tol=1e-6)
+
+
+def test_payloads_are_returned():
+    index = SpatialIndex([(40.7, -74.0), (34.05, -118.25)], ["New York", "Los Angeles"])
+    assert [name for _, name in index.nearest(40.0, -75.0, k=2)] == ["New York", "Los Angeles"]
+
+
+def test_empty_index():
+    index = SpatialIndex([])
+    assert len(index) == 0
+    assert index.within_radius(40.0, -75.0, 100) == []
+    assert index.nearest(40.0, -75.0, k=3) == []
+
+
+def test_nearest_with_fewer_points_than_k():
+    index = SpatialIndex([(40.7, -74.0)])
+    assert len(index.nearest(0.0, 0.0, k=5)) == 1
+    assert INDEX.nearest(40.0, -75.0, k=0) == []